@@ -1,24 +1,32 @@
+import json
+from itertools import islice
+
 from fastapi import Request, status
-from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
-from app.models.event_models import EventsErrorMessage
+MAX_REPORTED_ERRORS = 10
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """
     Override the default RequestValidationError exception, we want to return HTTP status code of 400
     and provide details. Rather than default of HTTP status code of 422
+
+    Only the first `MAX_REPORTED_ERRORS` errors are reported, the response body is serialised
+    directly to bytes, avoiding building a `EventsErrorMessage` model for every rejected request.
     """
-    return JSONResponse(
+    errors = exc.errors()
+    detail = [
+        f"{error['msg']} found in {error['loc']}"
+        for error in islice(errors, MAX_REPORTED_ERRORS)
+    ]
+    if len(errors) > MAX_REPORTED_ERRORS:
+        detail.append(f"{len(errors) - MAX_REPORTED_ERRORS} more error(s) not reported")
+    return Response(
+        content=json.dumps(
+            {"detail": detail}, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8"),
         status_code=status.HTTP_400_BAD_REQUEST,
-        content=jsonable_encoder(
-            EventsErrorMessage(
-                detail=[
-                    error["msg"] + " found in " + str(error["loc"])
-                    for error in exc.errors()
-                ]
-            )
-        ),
+        media_type="application/json",
     )
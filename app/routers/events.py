@@ -17,22 +17,43 @@ router = APIRouter(prefix="/v1/events", tags=["events"])
 @router.get(
     path="",
     operation_id="allEvents",
-    summary="Retrieve all system and user log event types",
+    summary="Retrieve or search all system and user log event types",
     response_model=List[EventLog],
     responses={400: {"model": EventsErrorMessage}, 500: {"model": EventsErrorMessage}},
     status_code=status.HTTP_200_OK,
 )
 async def get_event_logs(
     size: Annotated[int, Query(gt=0, le=1000)] = 10,
+    username: Annotated[str | None, Query(min_length=1)] = None,
+    email: Annotated[str | None, Query(min_length=1)] = None,
+    system_id: Annotated[str | None, Query(min_length=1)] = None,
+    prefix: bool = False,
     service: DemoService = Depends(get_demo_service()),
 ) -> List[EventLog]:
     """
     Return a number of stored event logs. Maximum of 1000 events are returned.
+    When `username`, `email` and/or `system_id` are provided, only event logs matching
+    all of them are returned.
 
     :param size: number of log events to return.
+    :param username: user event username to match.
+    :param email: user event email to match.
+    :param system_id: system event system id to match.
+    :param prefix: match values starting with those provided, rather than exact match.
     :param service: service layer for queries.
     :return: list of event logs.
     """
+    filters = {
+        field: value
+        for field, value in {
+            "username": username,
+            "email": email,
+            "system_id": system_id,
+        }.items()
+        if value is not None
+    }
+    if filters:
+        return service.search_event_logs(size, filters, prefix)
     return service.return_event_logs(size)
 
 
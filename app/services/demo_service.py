@@ -1,17 +1,26 @@
 import os
-from typing import List, Any
+from typing import List, Any, Dict, Tuple
 
 from fastapi import HTTPException
 from pydantic import ValidationError
 import pickle
 
 from app.models.event_models import EventLog, InsertResult
+from app.services.event_index import (
+    sync_event_index,
+    search_event_index,
+    append_to_event_index,
+    file_stamp,
+)
 
 MAX_SIZE = 1000
 PICKLE_FILENAME = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "data", "logging.pkl")
 )
 
+# Archive held in memory, `stamp` identifies the archive file it was loaded from / saved to.
+_archive_cache = {"stamp": None, "events": None}
+
 
 class DemoService:
     """
@@ -27,6 +36,19 @@ class DemoService:
         """
         return self.example_return_event_logs(size=size)
 
+    def search_event_logs(
+        self, size: int, filters: Dict[str, str], prefix: bool = False
+    ) -> List[EventLog]:
+        """
+        Return event logs stored within archive matching the filters provided.
+
+        :param size: number of events to return
+        :param filters: indexed field and value to match e.g. {"username": "my_user"}
+        :param prefix: match values starting with the filter value
+        :return: list of log events
+        """
+        return self.example_search_event_logs(size=size, filters=filters, prefix=prefix)
+
     def return_event_log(self, event_id: str) -> EventLog:
         """
         Return a single event log using the `event_id`.
@@ -69,6 +91,31 @@ class DemoService:
                 detail=f"An error occurred when attempting to retrieve all log records with: {e}",
             )
 
+    @staticmethod
+    def example_search_event_logs(
+        size: int, filters: Dict[str, str], prefix: bool
+    ) -> List[EventLog]:
+        """
+        Return stored event logs matching the filters, using the in-memory archive
+        and inverted index. Searching does not write to disk.
+
+        :param size: maximum number of event logs to return
+        :param filters: indexed field and value to match
+        :param prefix: match values starting with the filter value
+        :return: list of event logs
+        """
+        try:
+            stored_events, archive_stamp = load_cached_archive()
+        except (pickle.PicklingError, FileNotFoundError) as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"An error occurred when attempting to search log records with: {e}",
+            )
+        positions = search_event_index(
+            sync_event_index(stored_events, archive_stamp), filters, prefix, size
+        )
+        return [stored_events[position] for position in positions]
+
     @staticmethod
     def example_return_event_log(event_id: str):
         """
@@ -132,14 +179,37 @@ class DemoService:
         return results
 
 
+def load_cached_archive() -> Tuple[List[EventLog], Tuple[int, int] | None]:
+    """
+    Return the archive held in memory, only loading the pickle file when
+    it has changed since last loaded / saved. The list returned is shared
+    and must not be modified.
+
+    :return: list of event logs and the stamp of the archive file
+    """
+    stamp = file_stamp(PICKLE_FILENAME)
+    if _archive_cache["stamp"] != (PICKLE_FILENAME, stamp):
+        with open(PICKLE_FILENAME, "rb") as f:
+            _archive_cache["events"] = pickle.load(f)
+        _archive_cache["stamp"] = (PICKLE_FILENAME, stamp)
+    return _archive_cache["events"], stamp
+
+
 def bulk_amend_existing_pickle_file(contents: Any) -> None:
     """
     Open existing pickle file and load the data. Existing data
     should be a List of `EventLog`. Will write to existing pickle file
-    using extended list (appending to the end).
+    using extended list (appending to the end). The search index is then
+    updated with the appended event logs and persisted.
 
     :param contents: list of event logs
     """
-    previous_data = pickle.load(open(PICKLE_FILENAME, "rb"))
-    previous_data.extend(contents)
-    pickle.dump(previous_data, open(PICKLE_FILENAME, "wb"))
+    previous_data, previous_stamp = load_cached_archive()
+    index = sync_event_index(previous_data, previous_stamp)
+    data = previous_data + list(contents)
+    with open(PICKLE_FILENAME, "wb") as f:
+        pickle.dump(data, f)
+    stamp = file_stamp(PICKLE_FILENAME)
+    _archive_cache["events"] = data
+    _archive_cache["stamp"] = (PICKLE_FILENAME, stamp)
+    append_to_event_index(index, contents, stamp)
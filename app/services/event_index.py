@@ -0,0 +1,245 @@
+import heapq
+import logging
+import os
+import pickle
+from bisect import bisect_left
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
+
+from app.models.event_models import EventLog
+
+logger = logging.getLogger(__name__)
+
+INDEXED_FIELDS = ("username", "email", "system_id")
+INDEX_VERSION = 1
+INDEX_FILENAME = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "data", "logging_index.pkl")
+)
+
+# Index held in memory, `stamp` identifies the index file it was loaded from / saved to.
+_cache = {"stamp": None, "index": None}
+
+
+def file_stamp(filename: str) -> Tuple[int, int] | None:
+    """
+    Identify the current state of a file, using its modification time and size.
+
+    :param filename: file to stamp
+    :return: stamp of the file, or None when it does not exist
+    """
+    try:
+        stat = os.stat(filename)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+
+def new_event_index(archive_stamp: Tuple[int, int] | None) -> Dict[str, Any]:
+    """
+    Create an empty inverted index. For each indexed field, `postings` maps a value to
+    the archive positions of the event logs containing it and `keys` holds the same
+    values sorted, for prefix matching. `archive_stamp` is the stamp of the archive
+    file the index was built from.
+
+    :param archive_stamp: stamp of the archive file being indexed
+    :return: empty index
+    """
+    return {
+        "version": INDEX_VERSION,
+        "archive_stamp": archive_stamp,
+        "size": 0,
+        "postings": {field: {} for field in INDEXED_FIELDS},
+        "keys": {field: [] for field in INDEXED_FIELDS},
+    }
+
+
+def add_to_event_index(index: Dict[str, Any], events: Iterable[EventLog]) -> None:
+    """
+    Add event logs to the index, positions are assigned following on from
+    the number of event logs already indexed.
+
+    :param index: index to update
+    :param events: list of event logs appended to the archive
+    """
+    new_keys = {field: [] for field in INDEXED_FIELDS}
+    for event in events:
+        for field in INDEXED_FIELDS:
+            value = getattr(event.event, field, None)
+            if value is None:
+                continue
+            postings = index["postings"][field]
+            if value not in postings:
+                postings[value] = []
+                new_keys[field].append(value)
+            postings[value].append(index["size"])
+        index["size"] += 1
+
+    # Appending the new values as a sorted run lets `sort` merge them in a single pass,
+    # rather than shifting `keys` for every new value.
+    for field, values in new_keys.items():
+        if values:
+            index["keys"][field].extend(sorted(values))
+            index["keys"][field].sort()
+
+
+def _is_event_index(index: Any) -> bool:
+    """
+    Check a loaded index has the structure of the current index format.
+
+    :param index: loaded index
+    :return: whether the index can be used
+    """
+    return (
+        isinstance(index, dict)
+        and index.get("version") == INDEX_VERSION
+        and isinstance(index.get("size"), int)
+        and isinstance(index.get("postings"), dict)
+        and isinstance(index.get("keys"), dict)
+        and all(
+            isinstance(index["postings"].get(field), dict)
+            and isinstance(index["keys"].get(field), list)
+            for field in INDEXED_FIELDS
+        )
+    )
+
+
+def _read_event_index() -> Dict[str, Any] | None:
+    """
+    Load the index persisted alongside the archive.
+
+    :return: index, or None when missing, unreadable or not in the current format
+    """
+    try:
+        with open(INDEX_FILENAME, "rb") as f:
+            index = pickle.load(f)
+    except (pickle.UnpicklingError, OSError, EOFError):
+        return None
+    return index if _is_event_index(index) else None
+
+
+def sync_event_index(
+    events: List[EventLog], archive_stamp: Tuple[int, int] | None
+) -> Dict[str, Any]:
+    """
+    Return the in-memory index for the archive. The persisted index is only (re)loaded
+    when the index file has changed, the index is rebuilt when it was not built from
+    the archive with `archive_stamp` e.g. missing, corrupt or the archive has changed.
+
+    :param events: all event logs stored within archive
+    :param archive_stamp: stamp of the archive file `events` were loaded from
+    :return: index covering all event logs
+    """
+    stamp = (INDEX_FILENAME, file_stamp(INDEX_FILENAME))
+    if _cache["stamp"] != stamp:
+        _cache["stamp"] = stamp
+        _cache["index"] = _read_event_index()
+
+    index = _cache["index"]
+    if index is None or index["archive_stamp"] != archive_stamp:
+        index = new_event_index(archive_stamp)
+        add_to_event_index(index, events)
+        _cache["index"] = index
+    return index
+
+
+def append_to_event_index(
+    index: Dict[str, Any],
+    events: List[EventLog],
+    archive_stamp: Tuple[int, int] | None,
+) -> None:
+    """
+    Add event logs appended to the archive and persist the index alongside the archive.
+    Failing to write the index is logged rather than raised, it will be rebuilt from
+    the archive when next needed.
+
+    :param index: index of the archive before the event logs were appended
+    :param events: event logs appended to the archive
+    :param archive_stamp: stamp of the archive file after the event logs were appended
+    """
+    add_to_event_index(index, events)
+    index["archive_stamp"] = archive_stamp
+    _cache["index"] = index
+
+    temporary_filename = INDEX_FILENAME + ".tmp"
+    try:
+        with open(temporary_filename, "wb") as f:
+            pickle.dump(index, f)
+        os.replace(temporary_filename, INDEX_FILENAME)
+    except OSError as e:
+        logger.warning("Unable to save search index to %s: %s", INDEX_FILENAME, e)
+        return
+    _cache["stamp"] = (INDEX_FILENAME, file_stamp(INDEX_FILENAME))
+
+
+def _intersect_sorted(streams: List[Iterable[int]]) -> Iterator[int]:
+    """
+    Lazily intersect ascending streams of positions.
+
+    :param streams: ascending positions for each filter
+    :return: ascending positions found in every stream
+    """
+    if not streams:
+        return
+    first, *others = [iter(stream) for stream in streams]
+    heads = [next(other, None) for other in others]
+    for position in first:
+        for i, other in enumerate(others):
+            while heads[i] is not None and heads[i] < position:
+                heads[i] = next(other, None)
+            if heads[i] is None:
+                return
+        if all(head == position for head in heads):
+            yield position
+
+
+def _merge_sorted(lists: List[List[int]]) -> Iterator[int]:
+    """
+    Lazily merge ascending lists of positions, only the head of each list is
+    held on the heap so producing the first positions does not visit every list in full.
+
+    :param lists: ascending positions for each matched value
+    :return: ascending positions
+    """
+    heap = [(positions[0], i, 0) for i, positions in enumerate(lists) if positions]
+    heapq.heapify(heap)
+    while heap:
+        position, i, offset = heap[0]
+        yield position
+        offset += 1
+        if offset < len(lists[i]):
+            heapq.heapreplace(heap, (lists[i][offset], i, offset))
+        else:
+            heapq.heappop(heap)
+
+
+def search_event_index(
+    index: Dict[str, Any],
+    filters: Dict[str, str],
+    prefix: bool = False,
+    size: int | None = None,
+) -> List[int]:
+    """
+    Find archive positions of event logs matching all filters provided. Posting lists
+    are already sorted, so they are merged lazily and only `size` positions are produced.
+
+    :param index: index to search
+    :param filters: indexed field and value to match e.g. {"username": "my_user"}
+    :param prefix: match values starting with the filter value, rather than exact match
+    :param size: maximum number of positions to return
+    :return: sorted archive positions
+    """
+    streams = []
+    for field, value in filters.items():
+        postings = index["postings"][field]
+        if prefix:
+            keys = index["keys"][field]
+            matches = []
+            for key in islice(keys, bisect_left(keys, value), None):
+                if not key.startswith(value):
+                    break
+                matches.append(postings[key])
+            # Each event log has a single value per field, so merged positions are unique.
+            streams.append(_merge_sorted(matches))
+        else:
+            streams.append(postings.get(value, []))
+    return list(islice(_intersect_sorted(streams), size))
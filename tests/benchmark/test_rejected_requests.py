@@ -0,0 +1,29 @@
+import time
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.exceptions.events_exceptions import MAX_REPORTED_ERRORS
+from app.main import app
+
+client = TestClient(app)
+
+REQUESTS = 200
+MALFORMED_BODY = ["invalid"] * 1000
+
+
+def test_rejected_request_throughput() -> None:
+    """
+    Benchmark the number of malformed requests rejected per second, each request
+    body contains 1000 invalid event logs.
+    """
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        response = client.post(url="/v1/events", json=MALFORMED_BODY)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    elapsed = time.perf_counter() - start
+
+    assert len(response.json()["detail"]) == MAX_REPORTED_ERRORS + 1
+    print(
+        f"\nRejected {REQUESTS} requests in {elapsed:.2f}s ({REQUESTS / elapsed:.0f} req/s)"
+    )
@@ -1,16 +1,28 @@
 import os.path
+import shutil
 
 import pytest
 
-from app.services import demo_service
+from app.services import demo_service, event_index
 
 
 @pytest.fixture(autouse=True)
-def set_test_pickle_file_location(monkeypatch):
+def set_test_pickle_file_location(monkeypatch, tmp_path):
     """
-    Override file path, to load `test_data.pkl` file instead.
+    Override file path, to load a copy of `test_data.pkl` file instead. A copy is used
+    so event logs inserted by tests do not amend the `test_data.pkl` file.
     """
     directory_path = os.path.dirname(os.path.realpath(__file__))
+    pickle_filename = os.path.join(tmp_path, "test_data.pkl")
+    shutil.copy(os.path.join(directory_path, "test_data.pkl"), pickle_filename)
+    monkeypatch.setattr(demo_service, "PICKLE_FILENAME", pickle_filename)
+
+
+@pytest.fixture(autouse=True)
+def set_test_index_file_location(monkeypatch, tmp_path):
+    """
+    Override file path, so the search index is built into a temporary directory.
+    """
     monkeypatch.setattr(
-        demo_service, "PICKLE_FILENAME", os.path.join(directory_path, "test_data.pkl")
+        event_index, "INDEX_FILENAME", os.path.join(tmp_path, "test_index.pkl")
     )
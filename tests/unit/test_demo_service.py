@@ -98,3 +98,30 @@ def test_insert_event_logs_raises_http_400_exception(monkeypatch) -> None:
     with pytest.raises(HTTPException) as e:
         demo_service.DemoService().insert_event_logs(event_logs=example_event_log)
     assert e.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_should_search_event_logs() -> None:
+    service = DemoService()
+    result = service.search_event_logs(size=2, filters={"username": "my_user"})
+    assert [event.event_id for event in result] == ["u_001", "u_002"]
+
+
+def test_search_event_logs_raises_http_500_exception(monkeypatch) -> None:
+    monkeypatch.setattr(demo_service, "PICKLE_FILENAME", "invalid")
+    with pytest.raises(HTTPException) as e:
+        demo_service.DemoService().example_search_event_logs(
+            size=1, filters={"username": "my_user"}, prefix=False
+        )
+    assert e.value.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def test_search_event_logs_reuses_loaded_archive(monkeypatch) -> None:
+    service = DemoService()
+    service.search_event_logs(size=1, filters={"system_id": "id_100"})
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("archive should not be loaded again")
+
+    monkeypatch.setattr(demo_service.pickle, "load", fail_load)
+    result = service.search_event_logs(size=1, filters={"system_id": "id_500"})
+    assert [event.event_id for event in result] == ["s_005"]
@@ -0,0 +1,138 @@
+import os
+import pickle
+
+import pytest
+
+from app.models.event_models import EventLog, UserEvent, SystemEvent
+from app.services import event_index
+from app.services.event_index import (
+    new_event_index,
+    add_to_event_index,
+    sync_event_index,
+    search_event_index,
+    append_to_event_index,
+)
+
+STAMP = (1, 100)
+
+EVENTS = [
+    EventLog(
+        type="user",
+        timestamp="2024-01-01T13:45:10Z",
+        event_id="u_001",
+        event=UserEvent(
+            username="ben_tennyson", email="ben@email.com", operation="read"
+        ),
+    ),
+    EventLog(
+        type="user",
+        timestamp="2024-01-01T13:45:10Z",
+        event_id="u_002",
+        event=UserEvent(username="ben_10", email="ben_10@email.com", operation="write"),
+    ),
+    EventLog(
+        type="system",
+        timestamp="2024-01-01T13:45:10Z",
+        event_id="s_001",
+        event=SystemEvent(system_id="id_100", location="us", operation="read"),
+    ),
+]
+
+
+def test_search_event_index_exact_match() -> None:
+    index = new_event_index(STAMP)
+    add_to_event_index(index, EVENTS)
+    assert search_event_index(index, {"username": "ben_10"}) == [1]
+    assert search_event_index(index, {"system_id": "id_100"}) == [2]
+    assert search_event_index(index, {"username": "ben"}) == []
+
+
+def test_search_event_index_prefix_match() -> None:
+    index = new_event_index(STAMP)
+    add_to_event_index(index, EVENTS)
+    assert search_event_index(index, {"username": "ben"}, prefix=True) == [0, 1]
+    assert search_event_index(index, {"email": "ben@"}, prefix=True) == [0]
+    assert search_event_index(index, {"system_id": "id_2"}, prefix=True) == []
+
+
+def test_search_event_index_matches_all_filters() -> None:
+    index = new_event_index(STAMP)
+    add_to_event_index(index, EVENTS)
+    assert search_event_index(
+        index, {"username": "ben", "email": "ben_10"}, prefix=True
+    ) == [1]
+    assert (
+        search_event_index(index, {"username": "ben_10", "system_id": "id_100"}) == []
+    )
+
+
+def test_search_event_index_returns_limited_size() -> None:
+    index = new_event_index(STAMP)
+    add_to_event_index(index, EVENTS)
+    assert search_event_index(index, {"username": "ben"}, prefix=True, size=1) == [0]
+    assert search_event_index(index, {"email": "ben"}, prefix=True, size=5) == [0, 1]
+
+
+def test_sync_event_index_builds_index_without_persisting() -> None:
+    index = sync_event_index(EVENTS, STAMP)
+    assert index["size"] == 3
+    assert not os.path.exists(event_index.INDEX_FILENAME)
+    assert sync_event_index(EVENTS, STAMP) is index
+
+
+def test_append_to_event_index_adds_and_persists_events() -> None:
+    index = sync_event_index(EVENTS[:2], STAMP)
+    append_to_event_index(index, EVENTS[2:], (2, 150))
+    assert search_event_index(index, {"system_id": "id_100"}) == [2]
+    with open(event_index.INDEX_FILENAME, "rb") as f:
+        assert pickle.load(f) == index
+    assert sync_event_index(EVENTS, (2, 150)) is index
+
+
+def test_append_to_event_index_logs_failed_write(monkeypatch, tmp_path, caplog) -> None:
+    monkeypatch.setattr(
+        event_index, "INDEX_FILENAME", os.path.join(tmp_path, "missing", "index.pkl")
+    )
+    index = sync_event_index(EVENTS[:2], STAMP)
+    append_to_event_index(index, EVENTS[2:], (2, 150))
+    assert "Unable to save search index" in caplog.text
+    assert sync_event_index(EVENTS, (2, 150)) is index
+
+
+def test_sync_event_index_reloads_changed_index_file() -> None:
+    index = new_event_index(STAMP)
+    add_to_event_index(index, EVENTS[2:])
+    sync_event_index(EVENTS[2:], STAMP)
+    with open(event_index.INDEX_FILENAME, "wb") as f:
+        pickle.dump(index, f)
+    assert sync_event_index(EVENTS[2:], STAMP) == index
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"corrupt",
+        pickle.dumps({"size": 0}),
+        pickle.dumps({"version": 1, "size": 0, "postings": {}, "keys": {}}),
+        pickle.dumps(["invalid"]),
+    ],
+)
+def test_sync_event_index_rebuilds_unusable_index_file(contents) -> None:
+    with open(event_index.INDEX_FILENAME, "wb") as f:
+        f.write(contents)
+    index = sync_event_index(EVENTS, STAMP)
+    assert index["size"] == 3
+    assert search_event_index(index, {"username": "ben_10"}) == [1]
+
+
+def test_sync_event_index_rebuilds_when_archive_changes() -> None:
+    sync_event_index(EVENTS, STAMP)
+    # Same length, first and last `event_id`, with a different event log in the middle.
+    replaced = [
+        EVENTS[0],
+        EVENTS[2].model_copy(update={"event_id": "u_002"}),
+        EVENTS[2],
+    ]
+    index = sync_event_index(replaced, (2, 100))
+    assert search_event_index(index, {"username": "ben_10"}) == []
+    assert search_event_index(index, {"system_id": "id_100"}) == [1, 2]
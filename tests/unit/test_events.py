@@ -2,6 +2,7 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from app.exceptions import events_exceptions
 from app.main import app
 
 client = TestClient(app)
@@ -109,3 +110,51 @@ def test_insert_event_logs_valid_and_invalid_events() -> None:
         {"error": "", "event_id": "u_123", "success": True},
         {"error": "invalid_location", "event_id": "s_123", "success": False},
     ]
+
+
+def test_insert_event_logs_reports_limited_number_of_errors(monkeypatch) -> None:
+    monkeypatch.setattr(events_exceptions, "MAX_REPORTED_ERRORS", 2)
+    response = client.post(url="/v1/events", json=["invalid", "invalid", "invalid"])
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "detail": [
+            "Input should be a valid dictionary found in ('body', 0)",
+            "Input should be a valid dictionary found in ('body', 1)",
+            "1 more error(s) not reported",
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    "query, expected_event_ids",
+    [
+        ("username=my_user&size=2", ["u_001", "u_002"]),
+        ("email=my_user@email.com&size=1", ["u_001"]),
+        ("system_id=id_300", ["s_003"]),
+        ("system_id=id_&prefix=true&size=2", ["s_001", "s_002"]),
+        ("username=my_&system_id=id_&prefix=true", []),
+        ("username=unknown", []),
+    ],
+)
+def test_search_event_logs(query, expected_event_ids) -> None:
+    response = client.get(f"/v1/events?{query}")
+    assert response.status_code == status.HTTP_200_OK
+    assert [event["event_id"] for event in response.json()] == expected_event_ids
+
+
+def test_search_event_logs_after_insert() -> None:
+    body = [
+        {
+            "type": "system",
+            "timestamp": "2006-01-13T00:00:00Z",
+            "event_id": "s_999",
+            "event": {"system_id": "id_999", "location": "us", "operation": "read"},
+        }
+    ]
+    assert client.get("/v1/events?system_id=id_999").json() == []
+    client.post(url="/v1/events", json=body)
+    response = client.get("/v1/events?system_id=id_999")
+    assert [event["event_id"] for event in response.json()] == ["s_999"]
+    response = client.get("/v1/events?system_id=id_&prefix=true&size=1000")
+    assert [event["event_id"] for event in response.json()][-1] == "s_999"